@@ -1,30 +1,62 @@
 # from dataclasses import dataclass
 # from enum import Enum, auto
 # from typing import List, Tuple, Dict, Any
-import random
+import argparse
+from typing import List, Optional
 
+from landing_gear.functions.progress_bar import show_extension_progress
 from landing_gear.functions.run_simulation import print_simulation_result
-from landing_gear.functions.simulation_logic import simulate_landing_gear_extension
+from landing_gear.functions.simulation_logic import (
+    simulate_landing_gear_extension,
+    simulate_landing_gear_extension_seeded,
+)
+from landing_gear.functions.batch_simulation import simulate_batch
 from landing_gear.configurations.example_configurations import config_a, config_b
 
+# Public API, re-exported for library use alongside the landing-gear command
+__all__ = [
+    "main",
+    "print_simulation_result",
+    "show_extension_progress",
+    "simulate_batch",
+    "simulate_landing_gear_extension",
+    "simulate_landing_gear_extension_seeded",
+]
 
-def main() -> None:
+
+def main(argv: Optional[List[str]] = None) -> None:
     """Entry point for the landing-gear command."""
+    parser = argparse.ArgumentParser(description="Landing gear extension simulation")
+    parser.add_argument(
+        "--animate",
+        action="store_true",
+        help="play the progress bar in real time for the simulated extension",
+    )
+    args = parser.parse_args(argv)
+
     # Fix seed for reproducibility in teaching
-    random.seed(42)
+    seed = 42
 
     # You can adjust variation to show different runs
     variation_ms = 200
     sensor_noise_ms = 50
 
-    result_a = simulate_landing_gear_extension(
-        config_a, random_variation_ms=variation_ms, sensor_noise_ms=sensor_noise_ms
+    result_a = simulate_landing_gear_extension_seeded(
+        config_a,
+        random_variation_ms=variation_ms,
+        sensor_noise_ms=sensor_noise_ms,
+        seed=seed,
     )
+    show_extension_progress(result_a.total_time_ms if args.animate else 0)
     print_simulation_result(result_a)
 
-    result_b = simulate_landing_gear_extension(
-        config_b, random_variation_ms=variation_ms, sensor_noise_ms=sensor_noise_ms
+    result_b = simulate_landing_gear_extension_seeded(
+        config_b,
+        random_variation_ms=variation_ms,
+        sensor_noise_ms=sensor_noise_ms,
+        seed=seed,
     )
+    show_extension_progress(result_b.total_time_ms if args.animate else 0)
     print_simulation_result(result_b)
 
 
@@ -3,10 +3,14 @@
 # -----------------------------
 
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Iterable
 
+# Times are stored as int32 milliseconds in the simulation arrays (~24 days)
+MAX_TIME_MS = 2**31 - 1
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class GearConfiguration:
     name: str
     pump_latency_ms: int  # Time for hydraulic pump to spin up
@@ -14,3 +18,57 @@ class GearConfiguration:
     extension_distance_mm: int  # How far the actuator must travel
     lock_time_ms: int  # Time from "down" to "locked" sensor
     requirement_time_ms: int = 8000  # Requirement: must lock within 8 seconds
+    ideal_extension_time_ms: int = field(init=False, repr=False)  # Derived, see below
+
+    def __post_init__(self) -> None:
+        # Extension time only depends on the configuration, so work it out once
+        # Convert speed in mm per 100ms to mm per ms, time needed = distance / speed
+        if self.actuator_speed_mm_per_100ms <= 0:
+            raise ValueError("Actuator speed must be positive")
+        speed_mm_per_ms = self.actuator_speed_mm_per_100ms / 100.0
+        # Frozen dataclass, so the derived field has to bypass __setattr__
+        object.__setattr__(
+            self,
+            "ideal_extension_time_ms",
+            int(self.extension_distance_mm / speed_mm_per_ms),
+        )
+
+        # Stored as int32: times can't be negative (so subtracting variation
+        # can't wrap below int32 either), and the nominal sequence must fit
+        # before any variation or noise is added on top (see check_time_range)
+        for field_name in (
+            "pump_latency_ms",
+            "extension_distance_mm",
+            "lock_time_ms",
+            "requirement_time_ms",
+        ):
+            if getattr(self, field_name) < 0:
+                raise ValueError(f"{field_name} must not be negative")
+        if self.requirement_time_ms > MAX_TIME_MS:
+            raise ValueError(f"requirement_time_ms must not exceed {MAX_TIME_MS} ms")
+        if self.nominal_time_ms() > MAX_TIME_MS:
+            raise ValueError(
+                "pump latency + extension time + lock time must not exceed "
+                f"{MAX_TIME_MS} ms"
+            )
+
+    def nominal_time_ms(self) -> int:
+        """Pump, extension and lock time without any variation or noise."""
+        return self.pump_latency_ms + self.ideal_extension_time_ms + self.lock_time_ms
+
+
+def check_time_range(
+    configs: Iterable[GearConfiguration], variation_ms: int, sensor_noise_ms: int
+) -> None:
+    """
+    Make sure the longest possible timeline of every configuration still fits
+    in int32 milliseconds once each of the three stages gets variation_ms and
+    the sensor adds its noise. Configuration times are never negative, so
+    this bound also keeps the shortest timeline above the int32 minimum.
+    """
+    margin = 3 * abs(variation_ms) + abs(sensor_noise_ms)
+    for config in configs:
+        if config.nominal_time_ms() + margin > MAX_TIME_MS:
+            raise ValueError(
+                f"{config.name}: worst-case timeline exceeds {MAX_TIME_MS} ms"
+            )
@@ -2,11 +2,12 @@
 # 1. Simple landing gear states
 # -----------------------------
 
-from enum import Enum, auto
+from enum import IntEnum
 
 
-class GearState(Enum):
-    UP_LOCKED = auto()
-    TRANSITIONING_DOWN = auto()
-    DOWN_LOCKED = auto()
-    FAILURE_DETECTED = auto()
+# Integer codes so states can be stored in numpy arrays (see the timeline)
+class GearState(IntEnum):
+    UP_LOCKED = 0
+    TRANSITIONING_DOWN = 1
+    DOWN_LOCKED = 2
+    FAILURE_DETECTED = 3
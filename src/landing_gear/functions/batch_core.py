@@ -0,0 +1,53 @@
+# -----------------------------
+# Parallel batch kernel
+# (JIT-compiled when numba is installed)
+# -----------------------------
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional - fall back to plain Python
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function uncompiled."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(parallel=True, cache=True)
+def batch_core(
+    pump_latency_ms: np.ndarray,
+    ideal_extension_time_ms: np.ndarray,
+    lock_time_ms: np.ndarray,
+    requirement_time_ms: np.ndarray,
+    sensor_noise_ms: int,
+    pump_delay: np.ndarray,
+    extension_time: np.ndarray,
+    lock_delay: np.ndarray,
+    total_time_ms: np.ndarray,
+    meets_requirement: np.ndarray,
+) -> None:
+    """
+    extension_core for a whole batch, spread across threads with prange.
+    Config arrays have shape (N,). pump_delay, extension_time and lock_delay
+    come in as the (N, K) random variations and are overwritten with the stage
+    times; total_time_ms and meets_requirement are (N, K) outputs. The random
+    draws happen before the call so the parallel loop has no shared RNG state.
+    """
+    n_configs, n_trials = pump_delay.shape
+    for index in prange(n_configs * n_trials):
+        i = index // n_trials
+        j = index % n_trials
+        pump = max(pump_latency_ms[i] + pump_delay[i, j], 0)
+        extension = max(ideal_extension_time_ms[i] + extension_time[i, j], 0)
+        lock = max(lock_time_ms[i] + lock_delay[i, j], 0)
+        total = pump + extension + sensor_noise_ms + lock
+
+        pump_delay[i, j] = pump
+        extension_time[i, j] = extension
+        lock_delay[i, j] = lock
+        total_time_ms[i, j] = total
+        meets_requirement[i, j] = total <= requirement_time_ms[i]
@@ -0,0 +1,124 @@
+# -----------------------------
+# 6. Batch (Monte Carlo) simulation
+# -----------------------------
+
+from importlib.util import find_spec
+from typing import List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from landing_gear.configurations.configuration_parameters import (
+    GearConfiguration,
+    check_time_range,
+)
+
+# numba is only imported on the first batch run, so importing the package
+# (and the scalar simulation) doesn't pay for it
+NUMBA_AVAILABLE = find_spec("numba") is not None
+
+
+class BatchResult(NamedTuple):
+    # Every array has shape (configs, trials); times adds a trailing event axis
+    configs: List[GearConfiguration]
+    pump_delay_ms: np.ndarray
+    extension_time_ms: np.ndarray
+    lock_delay_ms: np.ndarray
+    total_time_ms: np.ndarray
+    times: np.ndarray
+    meets_requirement: np.ndarray
+
+
+def simulate_batch(
+    configs: Sequence[GearConfiguration],
+    n_trials: int,
+    variation_ms: int = 0,
+    sensor_noise_ms: int = 0,
+    rng: Optional[np.random.Generator] = None,
+) -> BatchResult:
+    """
+    Run n_trials randomised extensions for every configuration at once.
+    Same timing model as simulate_landing_gear_extension, but every array
+    has shape (len(configs), n_trials) so no Python loop runs per trial.
+    With numba installed the trials run in parallel (the first call compiles).
+    """
+    check_time_range(configs, variation_ms, sensor_noise_ms)
+    if rng is None:
+        rng = np.random.default_rng()
+
+    # Per-configuration constants, one entry per configuration. All times are
+    # int32 milliseconds (check_time_range above makes sure every stage and
+    # total fits), which halves the memory traffic compared with int64
+    pump_latency = np.array([c.pump_latency_ms for c in configs], dtype=np.int32)
+    lock_time = np.array([c.lock_time_ms for c in configs], dtype=np.int32)
+    ideal_extension = np.array(
+        [c.ideal_extension_time_ms for c in configs], dtype=np.int32
+    )
+    requirement = np.array([c.requirement_time_ms for c in configs], dtype=np.int32)
+
+    # One random draw per stage per trial. Each draw array is then reused
+    # in place for its stage time. Drawing up front keeps the RNG out of
+    # the parallel kernel below.
+    shape = (len(configs), n_trials)
+    pump_delay = rng.integers(
+        -variation_ms, variation_ms + 1, size=shape, dtype=np.int32
+    )
+    extension_time = rng.integers(
+        -variation_ms, variation_ms + 1, size=shape, dtype=np.int32
+    )
+    lock_delay = rng.integers(
+        -variation_ms, variation_ms + 1, size=shape, dtype=np.int32
+    )
+
+    if NUMBA_AVAILABLE:
+        from landing_gear.functions.batch_core import batch_core
+
+        # Multi-threaded over every (config, trial) pair
+        total_time_ms = np.empty(shape, dtype=np.int32)
+        meets_requirement = np.empty(shape, dtype=np.bool_)
+        batch_core(
+            pump_latency,
+            ideal_extension,
+            lock_time,
+            requirement,
+            sensor_noise_ms,
+            pump_delay,
+            extension_time,
+            lock_delay,
+            total_time_ms,
+            meets_requirement,
+        )
+    else:
+        # Constants as (N, 1) columns broadcast over trials; clip at zero
+        # in place with np.maximum(out=...)
+        pump_delay += pump_latency[:, None]
+        np.maximum(pump_delay, 0, out=pump_delay)
+        extension_time += ideal_extension[:, None]
+        np.maximum(extension_time, 0, out=extension_time)
+        lock_delay += lock_time[:, None]
+        np.maximum(lock_delay, 0, out=lock_delay)
+
+        # check_time_range guarantees the int32 sum can't overflow
+        total_time_ms = pump_delay + extension_time
+        total_time_ms += sensor_noise_ms
+        total_time_ms += lock_delay
+        meets_requirement = total_time_ms <= requirement[:, None]
+
+    # Timeline events as (N, K, 6): initial, command, pump ready, actuator
+    # extended, sensor triggered, locked. Failures follow from meets_requirement.
+    # Built as stage durations, then a running sum turns them into timestamps
+    times = np.zeros(shape + (6,), dtype=np.int32)
+    times[..., 2] = pump_delay
+    times[..., 3] = extension_time
+    times[..., 4] = sensor_noise_ms
+    times[..., 5] = lock_delay
+    np.cumsum(times, axis=-1, out=times)
+
+    return BatchResult(
+        configs=list(configs),
+        pump_delay_ms=pump_delay,
+        extension_time_ms=extension_time,
+        lock_delay_ms=lock_delay,
+        total_time_ms=total_time_ms,
+        times=times,
+        meets_requirement=meets_requirement,
+    )
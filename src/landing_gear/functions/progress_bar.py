@@ -4,6 +4,12 @@
 # -----------------------------
 
 import sys
+import time
+
+# Every possible bar for the default length and fill, indexed by filled length
+_BAR_LENGTH = 100
+_BAR_FILL = "#"
+_BARS = [_BAR_FILL * i + "-" * (_BAR_LENGTH - i) for i in range(_BAR_LENGTH + 1)]
 
 
 def progress_bar(
@@ -12,8 +18,8 @@ def progress_bar(
     prefix: str = "",
     suffix: str = "",
     decimals: int = 1,
-    length: int = 100,
-    fill: str = "#",
+    length: int = _BAR_LENGTH,
+    fill: str = _BAR_FILL,
 ) -> None:
     """
     Call in a loop to create terminal progress bar
@@ -27,8 +33,40 @@ def progress_bar(
         fill        - Optional  : bar fill character (Str)
         printEnd    - Optional  : end character (e.g. "\r", "\r\n") (Str)
     """
-    percent = ("{0:." + str(decimals) + "f}").format(100 * (iteration / float(total)))
+    percent = f"{100 * (iteration / float(total)):.{decimals}f}"
     filledLength = int(length * iteration // total)
-    bar = fill * filledLength + "-" * (length - filledLength)
+    if length == _BAR_LENGTH and fill == _BAR_FILL and 0 <= filledLength <= length:
+        bar = _BARS[filledLength]
+    else:
+        bar = fill * filledLength + "-" * (length - filledLength)
     sys.stdout.write(f"\r{prefix} |{bar}| {percent}% {suffix}")
-    sys.stdout.flush()
+    # Only flush at the start and the end, stdout buffers the steps in between
+    if iteration == 0 or iteration >= total:
+        sys.stdout.flush()
+
+
+def show_extension_progress(duration_ms: int = 0) -> None:
+    """
+    Draw the landing gear progress bar at 0% and 100%.
+    With duration_ms the bar waits that long in a single sleep before
+    completing, so the extension plays out in real time.
+    """
+    print("Starting extension of landing gear:")
+    progress_bar(
+        0,
+        100,
+        prefix="Extending Landing Gear: ",
+        suffix="Landing Gear Extended",
+        fill="#",
+    )
+    if duration_ms > 0:
+        time.sleep(duration_ms / 1000)
+    progress_bar(
+        100,
+        100,
+        prefix="Extending Landing Gear: ",
+        suffix="Landing Gear Extended",
+        fill="#",
+    )
+    print()
+    print()
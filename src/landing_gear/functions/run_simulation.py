@@ -2,28 +2,73 @@
 # 5. Run the simulation
 # -----------------------------
 
-from typing import Any, Dict
+from typing import List
 
+import numpy as np
 
-def print_simulation_result(result: Dict[str, Any]) -> None:
-    config = result["config"]
+from landing_gear.configurations.configuration_parameters import GearConfiguration
+from landing_gear.configurations.gear_states import GearState
+from landing_gear.functions.simulation_logic import SimulationResult
+
+
+# Message templates, one per event slot of a simulation timeline.
+# They are only filled in when a result is displayed.
+MSG_INITIAL = "Initial state: gear up and locked"
+MSG_COMMAND = "Command issued: GEAR DOWN"
+MSG_PUMP = "Hydraulic pump ready after {} ms"
+MSG_EXTENSION = "Actuator finished extending after {} ms"
+MSG_SENSOR = "Down-position sensor triggered (+{} ms noise)"
+MSG_LOCK = "Gear locked DOWN after additional {} ms"
+MSG_FAILURE = "Requirement breached (> {} ms). System would flag failure."
+
+TIMELINE_MESSAGES = (
+    MSG_INITIAL,
+    MSG_COMMAND,
+    MSG_PUMP,
+    MSG_EXTENSION,
+    MSG_SENSOR,
+    MSG_LOCK,
+    MSG_FAILURE,
+)
+
+
+def render_timeline(
+    times: np.ndarray, states: np.ndarray, config: GearConfiguration
+) -> List[str]:
+    """
+    Format the timeline arrays from simulate_landing_gear_extension as text.
+    Stage durations are recovered from the gaps between timestamps.
+    """
+    lines = []
+    for event, (t, state) in enumerate(zip(times, states)):
+        if state == GearState.FAILURE_DETECTED:
+            value = config.requirement_time_ms
+        else:
+            value = t - times[event - 1] if event else 0
+        msg = TIMELINE_MESSAGES[event].format(value)
+        lines.append(f"[t = {t:5d} ms]  {GearState(state).name:18s}  - {msg}")
+    return lines
+
+
+def print_simulation_result(result: SimulationResult) -> None:
+    config = result.config
     print("=" * 70)
     print(f"Simulation for {config.name}")
     print("=" * 70)
-    for t, msg, state in result["timeline"]:
-        print(f"[t = {t:5d} ms]  {state.name:18s}  - {msg}")
+    for line in render_timeline(result.times, result.states, config):
+        print(line)
 
     print("\nSummary:")
     print(
-        f"  Total time to DOWN_LOCKED: {result['total_time_ms']} ms "
-        f"({result['total_time_ms'] / 1000:.2f} s)"
+        f"  Total time to DOWN_LOCKED: {result.total_time_ms} ms "
+        f"({result.total_time_ms / 1000:.2f} s)"
     )
     print(
         f"  Requirement: must lock within {config.requirement_time_ms} ms "
         f"({config.requirement_time_ms / 1000:.2f} s)"
     )
 
-    if result["meets_requirement"]:
+    if result.meets_requirement:
         print("  ✅ Requirement MET")
     else:
         print("  ❌ Requirement NOT MET – configuration would be flagged for review")
@@ -0,0 +1,36 @@
+# -----------------------------
+# Numeric core of the simulation
+# -----------------------------
+
+from typing import Tuple
+
+
+def extension_core(
+    pump_latency_ms: int,
+    ideal_extension_time_ms: int,
+    lock_time_ms: int,
+    sensor_noise_ms: int,
+    pump_variation_ms: int,
+    extension_variation_ms: int,
+    lock_variation_ms: int,
+) -> Tuple[int, int, int, int, int]:
+    """
+    Timing arithmetic for one extension, on plain scalars only.
+    Returns (pump_delay, extension_time, sensor_delay, lock_delay, total) in ms.
+    Kept as plain Python: for a handful of scalars a JIT dispatcher costs
+    more per call than it saves.
+    """
+    # Pump spin-up, never negative
+    pump_delay = max(pump_latency_ms + pump_variation_ms, 0)
+
+    # Actuator extension
+    extension_time = max(ideal_extension_time_ms + extension_variation_ms, 0)
+
+    # Sensor detection (with optional noise)
+    sensor_delay = sensor_noise_ms
+
+    # Lock engagement
+    lock_delay = max(lock_time_ms + lock_variation_ms, 0)
+
+    total_time_ms = pump_delay + extension_time + sensor_delay + lock_delay
+    return pump_delay, extension_time, sensor_delay, lock_delay, total_time_ms
@@ -2,142 +2,200 @@
 # 3. Simulation logic
 # -----------------------------
 
-import random
-import time
-from typing import List, Tuple, Dict, Any
-from landing_gear.configurations.configuration_parameters import GearConfiguration
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from landing_gear.configurations.configuration_parameters import (
+    GearConfiguration,
+    check_time_range,
+)
 from landing_gear.configurations.gear_states import GearState
-from landing_gear.functions.progress_bar import progress_bar
+from landing_gear.functions.progress_bar import show_extension_progress
+from landing_gear.functions.simulation_core import extension_core
+
+
+class SimulationResult(NamedTuple):
+    config: GearConfiguration
+    times: np.ndarray  # Event timestamps in ms
+    states: np.ndarray  # GearState code per event
+    total_time_ms: int
+    meets_requirement: bool
+    failure_state_time: Optional[int]
+
+
+# Timeline as structure-of-arrays: one timestamp and one state code per event.
+# Messages are derived from the timestamps when the result is rendered.
+# The state sequence is the same for every run, so it is built once (read-only).
+_STATES_MET = np.array(
+    [
+        GearState.UP_LOCKED,  # Initial state
+        GearState.UP_LOCKED,  # Command issued (no time cost for the pilot move)
+        GearState.TRANSITIONING_DOWN,  # Hydraulic pump ready
+        GearState.TRANSITIONING_DOWN,  # Actuator extended
+        GearState.TRANSITIONING_DOWN,  # Down-position sensor triggered
+        GearState.DOWN_LOCKED,  # Gear locked down
+    ],
+    dtype=np.uint8,
+)
+_STATES_FAILED = np.append(_STATES_MET, np.uint8(GearState.FAILURE_DETECTED))
+_STATES_MET.flags.writeable = False
+_STATES_FAILED.flags.writeable = False
 
 
 def simulate_landing_gear_extension(
-    config: GearConfiguration, random_variation_ms: int = 0, sensor_noise_ms: int = 0
-) -> Dict[str, Any]:
+    config: GearConfiguration,
+    random_variation_ms: int = 0,
+    sensor_noise_ms: int = 0,
+    show_progress: bool = False,
+    rng: Optional[np.random.Generator] = None,
+) -> SimulationResult:
     """
     Simulate a landing-gear extension sequence for a given configuration.
     This is a conceptual simulation – no physics, just simple timing arithmetic.
+    Set show_progress to draw a (static) progress bar for the extension.
+    Pass rng to control the random variation; reuse one generator across
+    calls for a reproducible sequence of runs.
+    result.times is a fresh array each call; result.states is a shared
+    read-only array, copy it before modifying.
     """
-    # Once all the delays are initated, the time taken can be used to be the condition of a while loop for progress bar
-
-    timeline: List[Tuple[int, str, GearState]] = []
-
-    # Start in UP_LOCKED
-    current_state = GearState.UP_LOCKED
-    time_ms = 0
-    timeline.append((time_ms, "Initial state: gear up and locked", current_state))
-
-    # Command issued: handle moved to DOWN
-    # (no time cost for the pilot move in this simple model)
-    timeline.append((time_ms, "Command issued: GEAR DOWN", current_state))
-
-    # Pump spin-up
-    pump_delay = config.pump_latency_ms + random.randint(
-        -random_variation_ms, random_variation_ms
-    )
-    pump_delay = max(pump_delay, 0)  # don't allow negative
-
-    # Actuator extension
-    # Convert speed in mm per 100ms to mm per ms
-    speed_mm_per_ms = config.actuator_speed_mm_per_100ms / 100.0
-    # Time needed = distance / speed
-    if speed_mm_per_ms <= 0:
-        raise ValueError("Actuator speed must be positive")
-
-    ideal_extension_time = config.extension_distance_mm / speed_mm_per_ms
-
-    # Add optional random variation (e.g. due to load, temperature)
-    extension_time = int(ideal_extension_time) + random.randint(
-        -random_variation_ms, random_variation_ms
-    )
-    extension_time = max(extension_time, 0)
-
-    # Sensor detection (with optional noise)
-    sensor_delay = sensor_noise_ms
+    if random_variation_ms == 0 and sensor_noise_ms == 0:
+        # Deterministic reference run, no randomness involved. The cached
+        # result is shared, so hand back a writable copy of its timestamps
+        result = _simulate_deterministic(config)
+        result = result._replace(times=result.times.copy())
+    else:
+        # The nominal timeline is checked when the config is built, only
+        # variation and noise can push it out of range
+        check_time_range((config,), random_variation_ms, sensor_noise_ms)
+        if rng is None:
+            rng = np.random.default_rng()
+        result = _simulate(config, rng, random_variation_ms, sensor_noise_ms)
+    if show_progress:
+        show_extension_progress()
+    return result
+
+
+def simulate_landing_gear_extension_seeded(
+    config: GearConfiguration,
+    random_variation_ms: int = 0,
+    sensor_noise_ms: int = 0,
+    seed: int = 42,
+) -> SimulationResult:
+    """
+    Same as simulate_landing_gear_extension, but with its own generator seeded
+    from seed. Identical inputs give identical results, so they are memoised:
+    the result and its arrays are shared between calls and are read-only.
+    """
+    check_time_range((config,), random_variation_ms, sensor_noise_ms)
+    return _simulate_seeded_cached(config, random_variation_ms, sensor_noise_ms, seed)
 
-    # Lock engagement
-    lock_delay = config.lock_time_ms + random.randint(
-        -random_variation_ms, random_variation_ms
-    )
-    lock_delay = max(lock_delay, 0)
 
-    # Gather all the time_ms appended things
-    time_ms += pump_delay
-    current_state = GearState.TRANSITIONING_DOWN
-    timeline.append(
-        (time_ms, f"Hydraulic pump ready after {pump_delay} ms", current_state)
+@lru_cache(maxsize=256)
+def _simulate_seeded_cached(
+    config: GearConfiguration, random_variation_ms: int, sensor_noise_ms: int, seed: int
+) -> SimulationResult:
+    result = _simulate(
+        config, np.random.default_rng(seed), random_variation_ms, sensor_noise_ms
     )
-
-    time_ms += extension_time
-    timeline.append(
-        (
-            time_ms,
-            f"Actuator finished extending after {extension_time} ms",
-            current_state,
+    # Cached arrays are shared between callers, so don't let anyone modify them
+    result.times.flags.writeable = False
+    return result
+
+
+@lru_cache(maxsize=64)
+def _simulate_deterministic(config: GearConfiguration) -> SimulationResult:
+    # Specialised for no variation and no sensor noise: nothing to draw, so
+    # every stage takes its nominal time and the result only depends on config
+    pump_delay = max(config.pump_latency_ms, 0)
+    extension_time = max(config.ideal_extension_time_ms, 0)
+    lock_delay = max(config.lock_time_ms, 0)
+    total_time_ms = pump_delay + extension_time + lock_delay
+
+    result = _build_result(config, pump_delay, extension_time, 0, total_time_ms)
+    result.times.flags.writeable = False
+    return result
+
+
+def _simulate(
+    config: GearConfiguration,
+    rng: np.random.Generator,
+    random_variation_ms: int,
+    sensor_noise_ms: int,
+) -> SimulationResult:
+    # Read the configuration once into locals
+    pump_latency_ms = config.pump_latency_ms
+    ideal_extension_time_ms = config.ideal_extension_time_ms
+    lock_time_ms = config.lock_time_ms
+
+    # Random variation for pump, extension and lock (e.g. due to load, temperature)
+    draws = rng.integers(-random_variation_ms, random_variation_ms + 1, size=3)
+    pump_variation, extension_variation, lock_variation = draws.tolist()
+
+    pump_delay, extension_time, sensor_delay, lock_delay, total_time_ms = (
+        extension_core(
+            pump_latency_ms,
+            ideal_extension_time_ms,
+            lock_time_ms,
+            sensor_noise_ms,
+            pump_variation,
+            extension_variation,
+            lock_variation,
         )
     )
 
-    time_ms += sensor_delay
-    timeline.append(
-        (
-            time_ms,
-            f"Down-position sensor triggered (+{sensor_delay} ms noise)",
-            current_state,
-        )
+    return _build_result(
+        config, pump_delay, extension_time, sensor_delay, total_time_ms
     )
 
-    time_ms += lock_delay
-    current_state = GearState.DOWN_LOCKED
-    timeline.append(
-        (time_ms, f"Gear locked DOWN after additional {lock_delay} ms", current_state)
-    )
 
-    total_delay_time_ms = pump_delay + extension_time + sensor_delay + lock_delay
-
-    # Add a progress bar
-    steps = 100
-    counter = 0
-    sleep_per_step = (
-        total_delay_time_ms / steps / 1000
-    )  # Converting ms to seconds to make progress bar more even and reflects more accurate landing gear extension
-    print("Starting extension of landing gear:")
-    start_time = time.time()
-    while counter < steps + 1:
-        progress_bar(
-            counter,
-            steps,
-            prefix="Extending Landing Gear: ",
-            suffix="Landing Gear Extended",
-            fill="#",
-        )
-        time.sleep(sleep_per_step)
-        counter += 1
-    end_time = time.time()
-    time_taken = end_time - start_time
-    print()
-    print(f"Time taken to execute: {time_taken:.2f} seconds")
-    print()
+def _build_result(
+    config: GearConfiguration,
+    pump_delay: int,
+    extension_time: int,
+    sensor_delay: int,
+    total_time_ms: int,
+) -> SimulationResult:
+    requirement_time_ms = config.requirement_time_ms
 
-    total_time_ms = time_ms
+    # Work out every timestamp first, then write the timeline in one go
+    pump_ready_ms = pump_delay
+    extended_ms = pump_ready_ms + extension_time
+    sensor_triggered_ms = extended_ms + sensor_delay
 
     # Requirement check
-    meets_requirement = total_time_ms <= config.requirement_time_ms
+    meets_requirement = total_time_ms <= requirement_time_ms
 
     # Simple failure detection: if requirement not met, mark as failure state at requirement boundary
     failure_state_time = None
-    if not meets_requirement:
-        failure_state_time = config.requirement_time_ms
-        timeline.append(
-            (
+    if meets_requirement:
+        times = np.array(
+            [0, 0, pump_ready_ms, extended_ms, sensor_triggered_ms, total_time_ms],
+            dtype=np.int32,
+        )
+        states = _STATES_MET
+    else:
+        failure_state_time = requirement_time_ms
+        times = np.array(
+            [
+                0,
+                0,
+                pump_ready_ms,
+                extended_ms,
+                sensor_triggered_ms,
+                total_time_ms,
                 failure_state_time,
-                f"Requirement breached (> {config.requirement_time_ms} ms). System would flag failure.",
-                GearState.FAILURE_DETECTED,
-            )
+            ],
+            dtype=np.int32,
         )
-
-    return {
-        "config": config,
-        "timeline": timeline,
-        "total_time_ms": total_time_ms,
-        "meets_requirement": meets_requirement,
-        "failure_state_time": failure_state_time,
-    }
+        states = _STATES_FAILED
+
+    return SimulationResult(
+        config=config,
+        times=times,
+        states=states,
+        total_time_ms=total_time_ms,
+        meets_requirement=meets_requirement,
+        failure_state_time=failure_state_time,
+    )
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from landing_gear.configurations.configuration_parameters import (
+    MAX_TIME_MS,
+    GearConfiguration,
+)
+from landing_gear.configurations.example_configurations import config_a, config_b
+from landing_gear.functions import batch_simulation
+from landing_gear.functions.batch_simulation import simulate_batch
+
+VARIATION_MS = 200
+SENSOR_NOISE_MS = 50
+
+# Largest pump latency that keeps the worst-case timeline inside int32
+boundary_config = GearConfiguration(
+    name="Boundary",
+    pump_latency_ms=MAX_TIME_MS
+    - config_a.ideal_extension_time_ms
+    - config_a.lock_time_ms
+    - 3 * VARIATION_MS
+    - SENSOR_NOISE_MS,
+    actuator_speed_mm_per_100ms=config_a.actuator_speed_mm_per_100ms,
+    extension_distance_mm=config_a.extension_distance_mm,
+    lock_time_ms=config_a.lock_time_ms,
+    requirement_time_ms=MAX_TIME_MS,
+)
+
+
+def run_batch(monkeypatch, use_numba, configs):
+    # Without numba installed, batch_core runs as plain Python with range
+    monkeypatch.setattr(batch_simulation, "NUMBA_AVAILABLE", use_numba)
+    return simulate_batch(
+        configs, 500, VARIATION_MS, SENSOR_NOISE_MS, np.random.default_rng(1234)
+    )
+
+
+@pytest.mark.parametrize(
+    "configs",
+    [[config_a, config_b], [config_a, boundary_config]],
+    ids=["examples", "boundary"],
+)
+def test_numba_and_numpy_paths_agree(monkeypatch, configs):
+    kernel = run_batch(monkeypatch, True, configs)
+    vectorised = run_batch(monkeypatch, False, configs)
+
+    for field in kernel._fields:
+        if field == "configs":
+            continue
+        expected = getattr(vectorised, field)
+        actual = getattr(kernel, field)
+        assert actual.dtype == expected.dtype, field
+        np.testing.assert_array_equal(actual, expected, err_msg=field)
+
+
+def test_boundary_config_does_not_wrap(monkeypatch):
+    for use_numba in (True, False):
+        result = run_batch(monkeypatch, use_numba, [boundary_config])
+        assert result.total_time_ms.min() > 0
+        assert result.meets_requirement.all()
+
+
+def test_out_of_range_inputs_are_rejected():
+    with pytest.raises(ValueError):
+        simulate_batch([boundary_config], 1, VARIATION_MS + 1, SENSOR_NOISE_MS)
+    with pytest.raises(ValueError):
+        GearConfiguration("Too slow", MAX_TIME_MS, 8.0, 700, 300)
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        (-(2**31) + 100, 8.0, 700, 300),
+        (300, 8.0, -700, 300),
+        (300, 8.0, 700, -300),
+    ],
+    ids=["pump", "distance", "lock"],
+)
+def test_negative_times_are_rejected(fields):
+    with pytest.raises(ValueError):
+        GearConfiguration("Negative", *fields)
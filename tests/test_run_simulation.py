@@ -0,0 +1,17 @@
+from landing_gear.configurations.example_configurations import config_a
+from landing_gear.functions.run_simulation import render_timeline
+from landing_gear.functions.simulation_logic import simulate_landing_gear_extension
+
+
+def test_render_deterministic_timeline():
+    result = simulate_landing_gear_extension(config_a)
+    assert render_timeline(result.times, result.states, config_a) == [
+        "[t =     0 ms]  UP_LOCKED           - Initial state: gear up and locked",
+        "[t =     0 ms]  UP_LOCKED           - Command issued: GEAR DOWN",
+        "[t =   300 ms]  TRANSITIONING_DOWN  - Hydraulic pump ready after 300 ms",
+        "[t =  9050 ms]  TRANSITIONING_DOWN  - Actuator finished extending after 8750 ms",
+        "[t =  9050 ms]  TRANSITIONING_DOWN  - Down-position sensor triggered (+0 ms noise)",
+        "[t =  9350 ms]  DOWN_LOCKED         - Gear locked DOWN after additional 300 ms",
+        "[t =  8000 ms]  FAILURE_DETECTED    - Requirement breached (> 8000 ms). "
+        "System would flag failure.",
+    ]
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from landing_gear.configurations.example_configurations import config_a, config_b
+from landing_gear.functions.simulation_logic import (
+    _simulate,
+    _simulate_deterministic,
+    simulate_landing_gear_extension,
+    simulate_landing_gear_extension_seeded,
+)
+
+
+@pytest.mark.parametrize("config", [config_a, config_b], ids=["a", "b"])
+def test_deterministic_path_matches_zero_variation_run(config):
+    specialised = _simulate_deterministic(config)
+    general = _simulate(config, np.random.default_rng(), 0, 0)
+
+    np.testing.assert_array_equal(specialised.times, general.times)
+    np.testing.assert_array_equal(specialised.states, general.states)
+    assert specialised.times.dtype == general.times.dtype
+    assert specialised.total_time_ms == general.total_time_ms
+    assert specialised.meets_requirement == general.meets_requirement
+    assert specialised.failure_state_time == general.failure_state_time
+
+
+def test_deterministic_times_are_writable():
+    result = simulate_landing_gear_extension(config_a)
+    assert result.times.flags.writeable
+    result.times[0] = 1
+
+    # Editing one result must not leak into the cached timeline
+    assert simulate_landing_gear_extension(config_a).times[0] == 0
+
+
+def test_seeded_runs_are_cached():
+    first = simulate_landing_gear_extension_seeded(config_a, 200, 50, seed=42)
+    again = simulate_landing_gear_extension_seeded(config_a, 200, 50, seed=42)
+    assert first is again
+
+
+def test_seeded_runs_depend_on_the_seed():
+    results = [
+        simulate_landing_gear_extension_seeded(config_a, 200, 50, seed=seed)
+        for seed in range(5)
+    ]
+    assert len({result.total_time_ms for result in results}) > 1
+
+
+def test_seeded_arrays_are_read_only():
+    result = simulate_landing_gear_extension_seeded(config_a, 200, 50, seed=42)
+    assert not result.times.flags.writeable
+    assert not result.states.flags.writeable
+    with pytest.raises(ValueError):
+        result.times[0] = 1